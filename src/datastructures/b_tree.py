@@ -3,7 +3,8 @@
 This module provides a simple implementation of B-Tree nodes and B-Trees. See
 refs/btree.md for reference/more details.
 """
-from typing import Any, Generator, Optional
+from bisect import bisect_left, bisect_right
+from typing import Any, Generator, Iterable, Optional
 
 
 class BTreeNode:
@@ -20,6 +21,9 @@ class BTreeNode:
         Represents the children of a b-tree node
     """
 
+    # trees hold many nodes, so nodes go without a per-instance `__dict__`
+    __slots__ = ('keys', 'children')
+
     def __init__(self, keys: Optional[list[Any]] = None, children: Optional[list['BTreeNode']] = None):
         self.keys = keys if keys is not None else []
         self.children = children if children is not None else []
@@ -36,7 +40,7 @@ class BTreeNode:
         -----
         Every node in the tree is an internal node, except the leaves.
         """
-        return not self.is_leaf()
+        return len(self.children) > 0
 
     def is_leaf(self) -> bool:
         """Checks if the node is a leaf node
@@ -68,12 +72,57 @@ class BTreeNode:
         key
             Every key of every node in ascending order
         """
-        for i, c in enumerate(self.keys):
-            if self.is_internal():
-                yield from self.children[i].traverse_inorder()
-            yield c
-        if self.is_internal():
-            yield from self.children[-1].traverse_inorder()
+        for run in self._traverse_inorder_runs():
+            yield from run
+
+    def traverse_inorder_list(self) -> list[Any]:
+        """Performs in-order traversal of the tree rooted at this node
+
+        Unlike `traverse_inorder`, the keys are collected into a list, which
+        avoids the cost of yielding every key one by one (leaves' keys are
+        copied in bulk).
+
+        Returns
+        -------
+        list
+            Every key of every node in ascending order
+        """
+        keys = []
+        for run in self._traverse_inorder_runs():
+            keys.extend(run)
+        return keys
+
+    def _traverse_inorder_runs(self) -> Generator[list[Any], None, None]:
+        """Performs in-order traversal of the tree rooted at this node, a run
+        of keys at a time
+
+        Yields
+        ------
+        list
+            The keys of every leaf, and (as one-key lists) the keys of every
+            internal node, in ascending order. The lists of the leaves' keys
+            are the leaves' own lists, so they mustn't be modified
+
+        Notes
+        -----
+        The traversal is iterative. Each item in the stack is a two-element
+        tuple: the first element is a node and the second element is the idx
+        of the next child of that node to visit.
+        """
+        stack = [(self, 0)]
+        while stack:
+            node, child_idx = stack.pop()
+            if not node.children:
+                yield node.keys
+                continue
+
+            # the key between the child that has just been visited and the
+            # next one
+            if child_idx > 0:
+                yield node.keys[(child_idx-1):child_idx]
+            if child_idx < len(node.keys):
+                stack.append((node, child_idx + 1))
+            stack.append((node.children[child_idx], 0))
 
 
 class BTree:
@@ -85,15 +134,178 @@ class BTree:
     Attributes
     ----------
     order : int
-        Represents the order of the B-Tree
+        Represents the order of the B-Tree. Defaults to
+        `BTree.recommended_order()`
     root : BTreeNode
         The root node of the B-Tree
     """
 
-    def __init__(self, order: int, root: Optional[BTreeNode] = None):
-        self.order = order
+    def __init__(self, order: Optional[int] = None, root: Optional[BTreeNode] = None):
+        self.order = order if order is not None else self.recommended_order()
+        # setting the root also sets `_height` and `_leaf_cache`
         self.root = root
 
+    @property
+    def root(self) -> Optional[BTreeNode]:
+        """The root node of the B-Tree"""
+        return self._root
+
+    @root.setter
+    def root(self, root: Optional[BTreeNode]) -> None:
+        self._root = root
+
+        # the leaf the last insertion occured on, if it was inserted into
+        # without splitting. it's a 3-element tuple: the leaf and the
+        # (exclusive) lower and (inclusive) upper bounds of the keys that
+        # belong to it, where `None` means unbounded. the leaf may no longer
+        # be in the tree once the root changes
+        self._leaf_cache = None
+
+        # the number of edges from the root to any leaf. used to pre-size the
+        # paths built while inserting/removing keys. it's recomputed whenever
+        # the root changes, so that the root can be replaced from outside
+        self._height = 0
+        node = root
+        while node is not None and node.children:
+            node = node.children[0]
+            self._height += 1
+
+    @staticmethod
+    def recommended_order(key_size_bytes: int = 8, node_target_bytes: int = 1024) -> int:
+        """Suggests an order whose nodes take up about `node_target_bytes`
+
+        Parameters
+        ----------
+        key_size_bytes : int
+            The size of a key in bytes
+        node_target_bytes : int
+            The targeted size of a node in bytes
+
+        Returns
+        -------
+        int
+            The suggested order, which is at least 3
+
+        Notes
+        -----
+        Each level traversed by `search`, `insert` and `remove` costs roughly
+        one cache miss, and comparing keys within a node is cheap in
+        comparison. Larger orders make for shorter trees, so orders yielding
+        nodes of about 1KB (64 for 8-byte keys) tend to outperform the small
+        orders. Every key is accounted for along with an 8-byte child
+        reference.
+        """
+        return max(3, node_target_bytes // (key_size_bytes + 8))
+
+    @classmethod
+    def bulk_load(cls, keys: Iterable[Any], order: Optional[int] = None) -> 'BTree':
+        """Builds a B-Tree containing the given keys
+
+        Parameters
+        ----------
+        keys : iterable
+            The keys to be inserted. They needn't be sorted, but sorted keys
+            are sorted in linear time
+        order : int, optional
+            The order of the B-Tree
+
+        Returns
+        -------
+        BTree
+            The B-Tree containing (exactly) the given keys
+
+        Notes
+        -----
+        The tree is built bottom-up, one level at a time, rather than by
+        inserting keys one by one. The keys are first spread evenly among as
+        few leaves as possible, with one key set aside to separate every two
+        adjacent leaves. The nodes of each level (and the separating keys
+        between them) are then spread among as few parents as possible the
+        same way, until a level consists of the root only. Spreading evenly
+        among as few nodes as possible guarantees no node has fewer keys than
+        the required minimum.
+        """
+        tree = cls(order)
+        keys = cls._sorted_keys(keys)
+        if keys:
+            tree.root = tree._build_from_sorted_keys(keys)
+        return tree
+
+    def _build_from_sorted_keys(self, keys: list[Any]) -> BTreeNode:
+        """Builds the nodes of a B-Tree of this tree's order bottom-up, as
+        described in `bulk_load`
+
+        Parameters
+        ----------
+        keys : list
+            The (non-empty) keys, already sorted and checked for `None`
+
+        Returns
+        -------
+        BTreeNode
+            The root of the built nodes
+        """
+        max_keys = self.order - 1
+
+        # a level with n keys spread over m leaves sets aside m-1 separators
+        leaves_count = -(-(len(keys) + 1) // (max_keys + 1))
+        keys_per_leaf, extra_keys = divmod(len(keys) - leaves_count + 1, leaves_count)
+        nodes = []
+        separators = []
+        pos = 0
+        for i in range(leaves_count):
+            leaf_keys_count = keys_per_leaf + (i < extra_keys)
+            nodes.append(BTreeNode(keys[pos:(pos+leaf_keys_count)]))
+            pos += leaf_keys_count
+            if pos < len(keys):
+                separators.append(keys[pos])
+                pos += 1
+
+        while len(nodes) > 1:
+            parents_count = -(-len(nodes) // self.order)
+            children_per_parent, extra_children = divmod(len(nodes), parents_count)
+            parents = []
+            parents_separators = []
+            pos = 0
+            for i in range(parents_count):
+                children_count = children_per_parent + (i < extra_children)
+                parents.append(BTreeNode(
+                    separators[pos:(pos+children_count-1)],
+                    nodes[pos:(pos+children_count)]))
+                pos += children_count
+                if pos < len(nodes):
+                    parents_separators.append(separators[pos - 1])
+            nodes = parents
+            separators = parents_separators
+
+        return nodes[0]
+
+    @staticmethod
+    def _sorted_keys(keys: Iterable[Any]) -> list[Any]:
+        """Sorts keys that are about to be inserted into a B-Tree
+
+        Parameters
+        ----------
+        keys : iterable
+            The keys to be inserted
+
+        Returns
+        -------
+        list
+            The keys in ascending order
+
+        Raises
+        ------
+        ValueError
+            If any of the keys is `None`
+        """
+        keys = list(keys)
+        # checked before sorting, as sorting would fail on `None` first
+        if any(k is None for k in keys):
+            raise ValueError("Attempted to insert key `None`")
+        keys.sort()
+        return keys
+
     def traverse_inorder(self) -> Generator[Any, None, None]:
         """Returns the inorder traversal of the B-Tree
 
@@ -105,6 +317,16 @@ class BTree:
         if self.root:
             yield from self.root.traverse_inorder()
 
+    def traverse_inorder_list(self) -> list[Any]:
+        """Returns the inorder traversal of the B-Tree as a list
+
+        Returns
+        -------
+        list
+            The inorder traversal
+        """
+        return self.root.traverse_inorder_list() if self.root else []
+
     def search(self, target: Any) -> Optional[BTreeNode]:
         """Searches for a key in a B-Tree
 
@@ -124,16 +346,14 @@ class BTree:
 
         curr_node = self.root
         while curr_node:
-            curr_key_idx = 0
-            while curr_key_idx < len(curr_node.keys)\
-                    and target > curr_node.keys[curr_key_idx]:
-                curr_key_idx += 1
+            curr_key_idx = bisect_left(curr_node.keys, target)
 
             if curr_key_idx != len(curr_node.keys) \
                     and target == curr_node.keys[curr_key_idx]:
                 return curr_node
 
-            curr_node = curr_node.children[curr_key_idx]
+            curr_node = curr_node.children[curr_key_idx] \
+                if curr_node.children else None
         return None
 
     def insert(self, key: Any) -> None:
@@ -151,31 +371,117 @@ class BTree:
             self.root = BTreeNode([key])
             return
 
+        # clustered insertions keep hitting the same leaf, which can then be
+        # inserted into without descending from the root
+        if self._leaf_cache is not None:
+            leaf, lower, upper = self._leaf_cache
+            if (lower is None or lower < key) and (upper is None or key <= upper) \
+                    and len(leaf.keys) < self.order - 1:
+                leaf.insert_key(bisect_left(leaf.keys, key), key)
+                return
+
+        path, lower, upper = self._find_target_leaf(key)
+        leaf, leaf_key_idx = path[-1]
+        leaf.insert_key(leaf_key_idx, key)
+
+        if len(leaf.keys) <= self.order - 1:
+            self._leaf_cache = (leaf, lower, upper)
+            return
+
+        # splits change the leaf's bounds
+        self._leaf_cache = None
+        self._fix_insert(path)
+
+    def insert_many(self, keys: Iterable[Any]) -> None:
+        """Inserts many keys into the B-Tree
+
+        Parameters
+        ----------
+        keys : iterable
+            The keys to be inserted
+
+        Notes
+        -----
+        The keys are sorted first, so that the keys destined for the same leaf
+        come in a run. Each run takes a single descent from the root: the leaf
+        absorbs as many keys of the run as it has room for in one go, and only
+        the key that makes it overflow is inserted (and split on) normally. An
+        empty tree is built bottom-up instead, like `bulk_load` does.
+        """
+        keys = self._sorted_keys(keys)
+        if not keys:
+            return
+
+        if not self.root:
+            self.root = self._build_from_sorted_keys(keys)
+            return
+
+        self._leaf_cache = None
+        max_keys = self.order - 1
+        keys_idx = 0
+        while keys_idx < len(keys):
+            path, _, upper = self._find_target_leaf(keys[keys_idx])
+            leaf, leaf_key_idx = path[-1]
+
+            room = max_keys - len(leaf.keys)
+            if room == 0:
+                leaf.insert_key(leaf_key_idx, keys[keys_idx])
+                self._fix_insert(path)
+                keys_idx += 1
+                continue
+
+            # the end of the run of keys that belong to the leaf
+            run_end = len(keys) if upper is None \
+                else bisect_right(keys, upper, keys_idx)
+            run_end = min(run_end, keys_idx + room)
+            # both are sorted, so sorting merges them in linear time
+            leaf.keys.extend(keys[keys_idx:run_end])
+            leaf.keys.sort()
+            keys_idx = run_end
+
+    def _find_target_leaf(self, key: Any) -> tuple[list[tuple[BTreeNode, int]], Any, Any]:
+        """Finds the leaf that `key` should be inserted into
+
+        Parameters
+        ----------
+        key
+            The key to be inserted
+
+        Returns
+        -------
+        path : list of tuple[BTreeNode, int]
+            The nodes on the path to the leaf (inclusive). Each item is a
+            two-element tuple: the first element is the node itself and the
+            second element is the idx of the next node in this node's list of
+            children (for the leaf, the idx `key` should be inserted at)
+        lower, upper
+            The (exclusive) lower and (inclusive) upper bounds of the keys that
+            belong to the leaf, where `None` means unbounded
+        """
         # stores nodes that are on the path to the leaf that the insertion occurs
-        # on. the items are 2-element tuples: the first element is the node
-        # itself and the second element is the idx of the next node in this
-        # node's list of children
-        path = []
+        # on
+        path = [None] * (self._height + 1)
 
+        # the bounds of the keys that belong to the subtree rooted at curr_node
+        lower = upper = None
+
+        depth = 0
         curr_node = self.root
         while True:
-            curr_key_idx = 0
-            while curr_key_idx < len(curr_node.keys) \
-                    and key > curr_node.keys[curr_key_idx]:
-                curr_key_idx += 1
+            curr_key_idx = bisect_left(curr_node.keys, key)
 
             # curr_key_idx is also the index -- in curr_node.children -- of the
             # child node to move to
-            path.append((curr_node, curr_key_idx))
-            if curr_node.is_leaf():
-                break
-
+            path[depth] = (curr_node, curr_key_idx)
+            if not curr_node.children:
+                return path, lower, upper
+
+            if curr_key_idx > 0:
+                lower = curr_node.keys[curr_key_idx - 1]
+            if curr_key_idx < len(curr_node.keys):
+                upper = curr_node.keys[curr_key_idx]
             curr_node = curr_node.children[curr_key_idx]
-
-        leaf, leaf_key_idx = path[-1]
-        leaf.insert_key(leaf_key_idx, key)
-
-        self._fix_insert(path)
+            depth += 1
 
     def _fix_insert(self, path: list[BTreeNode]) -> None:
         """Restructures the tree -- after inserting a key -- to maintain the
@@ -193,29 +499,28 @@ class BTree:
         -----
         See refs/btree.md for more details
         """
+        max_keys = self.order - 1
+        mid_key_idx = max_keys // 2
+
         node_idx_in_path = len(path) - 1
         while node_idx_in_path >= 0:
             curr_node, _ = path[node_idx_in_path]
-            if len(curr_node.keys) <= self.order - 1:
+            if len(curr_node.keys) <= max_keys:
                 return
 
-            mid_key_idx = (self.order - 1) // 2
-
-            left_node = BTreeNode(
-                curr_node.keys[:mid_key_idx], curr_node.children[:(mid_key_idx+1)])
+            # `curr_node` is reused as the left node; only the right node is
+            # newly created
+            pivot = curr_node.keys[mid_key_idx]
             right_node = BTreeNode(
                 curr_node.keys[(mid_key_idx+1):], curr_node.children[(mid_key_idx+1):])
+            del curr_node.keys[mid_key_idx:]
+            del curr_node.children[(mid_key_idx+1):]
 
             if node_idx_in_path == 0:
-                new_root = BTreeNode([curr_node.keys[mid_key_idx]], [
-                                     left_node, right_node])
-                self.root = new_root
+                self.root = BTreeNode([pivot], [curr_node, right_node])
             else:
                 parent, idx_node_as_child = path[node_idx_in_path - 1]
-                parent.insert_key(idx_node_as_child,
-                                  curr_node.keys[mid_key_idx])
-
-                parent.children[idx_node_as_child] = left_node
+                parent.insert_key(idx_node_as_child, pivot)
                 parent.children.insert(idx_node_as_child + 1, right_node)
 
             node_idx_in_path -= 1
@@ -231,109 +536,111 @@ class BTree:
         if key is None:
             raise ValueError("Attempted to remove key `None`")
 
-        target_node = self.root
-        path = [(target_node, None)]
-
-        while target_node:
-            target_node_key_idx = 0
-            while target_node_key_idx < len(target_node.keys) \
-                    and key > target_node.keys[target_node_key_idx]:
-                target_node_key_idx += 1
+        if not self.root:
+            raise ValueError(f"Attempted to remove a non-existing key `{key}`")
 
-            if target_node_key_idx < len(target_node.keys) \
-                    and key == target_node.keys[target_node_key_idx]:
-                break
+        # removals may replace keys of internal nodes, merge leaves and move
+        # keys between them, all of which may change the cached leaf's bounds
+        self._leaf_cache = None
 
-            if target_node.is_internal():
-                target_node = target_node.children[target_node_key_idx]
+        # stores nodes that are on the path to the leaf that the removal occurs
+        # on. the items are 2-element tuples: the first element is the node
+        # itself and the second element is the idx of the node in its parent's
+        # list of children
+        path = [None] * (self._height + 1)
+        path[0] = (self.root, None)
+
+        # the descent looks for the key and -- once it's found in an internal
+        # node -- carries on to the left-most leaf of the subtree to its right
+        # (i.e. the leaf holding its successor), all in a single pass
+        target_node = None
+        depth = 0
+        curr_node = self.root
+        while True:
+            if target_node is None:
+                curr_key_idx = bisect_left(curr_node.keys, key)
+                if curr_key_idx < len(curr_node.keys) \
+                        and key == curr_node.keys[curr_key_idx]:
+                    target_node, target_node_key_idx = curr_node, curr_key_idx
+                    curr_key_idx += 1
+                elif not curr_node.children:
+                    raise ValueError(
+                        f"Attempted to remove a non-existing key `{key}`")
             else:
-                target_node = None
-            path.append((target_node, target_node_key_idx))
-
-        if target_node is None:
-            raise ValueError(f"Attempted to remove a non-existing key `{key}`")
+                curr_key_idx = 0
 
-        if target_node.is_internal():
-            leaf = target_node.children[target_node_key_idx + 1]
-            path.append((leaf, target_node_key_idx + 1))
-            while leaf.is_internal():
-                leaf = leaf.children[0]
-                path.append((leaf, 0))
+            if not curr_node.children:
+                break
+            curr_node = curr_node.children[curr_key_idx]
+            depth += 1
+            path[depth] = (curr_node, curr_key_idx)
 
-            target_node.keys[target_node_key_idx] = leaf.keys[0]
-            del leaf.keys[0]
-        else:
+        if target_node is curr_node:
             del target_node.keys[target_node_key_idx]
+        else:
+            target_node.keys[target_node_key_idx] = curr_node.keys.pop(0)
 
         self._fix_remove(path)
 
-    def _fix_remove(self, path: tuple[BTreeNode, int]) -> None:
+    def _fix_remove(self, path: list[tuple[BTreeNode, int]]) -> None:
         """Fixes the B-Tree after removals if necessary
 
         Parameters
         ----------
-        path : tuple[BTreeNode, int]
+        path : list of tuple[BTreeNode, int]
             The path to the leaf whose key has just been deleted. The root is
-            the first element in the tuple
+            the first element in the list. Each item is a two-element tuple:
+            the first element is the node itself and the second element is
+            the idx of the node in its parent's list of children
 
         Notes
         -----
+        The fix-up is done bottom-up (rather than preemptively, while
+        descending) since, in trees of odd orders, merging two siblings that
+        have the minimum number of keys with the key between them would
+        overflow the merged node.
+
         See refs/btree.md for more details
         """
+        min_keys = (self.order - 1) // 2
+
+        # the root (at idx 0) can't underflow, so it's handled after the loop
         curr_node_idx_in_path = len(path) - 1
-        while curr_node_idx_in_path >= 0:
+        while curr_node_idx_in_path > 0:
             curr_node, curr_node_child_idx = path[curr_node_idx_in_path]
-
-            if curr_node is self.root and len(curr_node.children) == 1:
-                self.root = curr_node.children[0]
-                return
-            if not self._is_node_underflowing(curr_node):
+            if len(curr_node.keys) >= min_keys:
                 return
 
             parent_curr_node, _ = path[curr_node_idx_in_path - 1]
             # `curr_node` has left siblings
             if curr_node_child_idx != 0:
                 left_sibling = parent_curr_node.children[curr_node_child_idx - 1]
-                if self._is_node_populous(left_sibling):
-                    merged_keys = left_sibling.keys \
-                        + [parent_curr_node.keys[curr_node_child_idx - 1]] \
-                        + curr_node.keys
-                    merged_children = left_sibling.children + curr_node.children
-
-                    # merge keys
-                    merged_keys_mid_idx = len(merged_keys)//2
+                if len(left_sibling.keys) > min_keys:
+                    # rotate the last key/child of the left sibling through
+                    # the parent into `curr_node`
+                    curr_node.keys.insert(
+                        0, parent_curr_node.keys[curr_node_child_idx - 1])
                     parent_curr_node.keys[curr_node_child_idx - 1] = \
-                        merged_keys[merged_keys_mid_idx]
-                    left_sibling.keys = merged_keys[:merged_keys_mid_idx]
-                    curr_node.keys = merged_keys[(merged_keys_mid_idx+1):]
-
-                    left_sibling.children = merged_children[:(
-                        merged_keys_mid_idx+1)]
-                    curr_node.children = merged_children[(
-                        merged_keys_mid_idx+1):]
-                    break
+                        left_sibling.keys.pop()
+                    if left_sibling.children:
+                        curr_node.children.insert(
+                            0, left_sibling.children.pop())
+                    return
 
             # `curr_node` has right siblings
             if curr_node_child_idx != len(parent_curr_node.children) - 1:
                 right_sibling = parent_curr_node.children[curr_node_child_idx + 1]
-                if self._is_node_populous(right_sibling):
-                    merged_keys = curr_node.keys \
-                        + [parent_curr_node.keys[curr_node_child_idx]] \
-                        + right_sibling.keys
-                    merged_children = curr_node.children + right_sibling.children
-
-                    merged_keys_mid_idx = len(merged_keys) // 2
-
-                    curr_node.keys = merged_keys[:merged_keys_mid_idx]
+                if len(right_sibling.keys) > min_keys:
+                    # rotate the first key/child of the right sibling through
+                    # the parent into `curr_node`
+                    curr_node.keys.append(
+                        parent_curr_node.keys[curr_node_child_idx])
                     parent_curr_node.keys[curr_node_child_idx] = \
-                        merged_keys[merged_keys_mid_idx]
-                    right_sibling.keys = merged_keys[(merged_keys_mid_idx+1):]
-
-                    curr_node.children = merged_children[:(
-                        merged_keys_mid_idx+1)]
-                    right_sibling.children = merged_children[(
-                        merged_keys_mid_idx+1):]
-                    break
+                        right_sibling.keys.pop(0)
+                    if right_sibling.children:
+                        curr_node.children.append(
+                            right_sibling.children.pop(0))
+                    return
 
             # if execution reaches this line, then `curr_node` either
             # 1. has no right siblings and the left sibling isn't populous or,
@@ -341,60 +648,25 @@ class BTree:
 
             # case 1
             if curr_node_child_idx == len(parent_curr_node.children) - 1:
-                merged_node = left_sibling
-                del parent_curr_node.children[curr_node_child_idx]
-
-                merged_node.keys.append(
-                    parent_curr_node.keys.pop(curr_node_child_idx - 1))
-                merged_node.keys.extend(curr_node.keys)
-                merged_node.children.extend(curr_node.children)
+                pivot_idx = curr_node_child_idx - 1
+                merged_node, absorbed_node = left_sibling, curr_node
             # case 2
             else:
-                merged_node = curr_node
-                del parent_curr_node.children[curr_node_child_idx + 1]
-                merged_node.keys.append(
-                    parent_curr_node.keys.pop(curr_node_child_idx))
-                merged_node.keys.extend(right_sibling.keys)
-                merged_node.children.extend(right_sibling.children)
+                pivot_idx = curr_node_child_idx
+                merged_node, absorbed_node = curr_node, right_sibling
+
+            # the pivot and the absorbed node's keys/children are appended with
+            # slice assignments, each of which resizes the list at most once
+            pivot = parent_curr_node.keys[pivot_idx]
+            del parent_curr_node.keys[pivot_idx]
+            del parent_curr_node.children[pivot_idx + 1]
+            merged_keys_count = len(merged_node.keys)
+            merged_node.keys[merged_keys_count:] = [pivot]
+            merged_node.keys[(merged_keys_count+1):] = absorbed_node.keys
+            merged_node.children[len(merged_node.children):] = absorbed_node.children
 
             curr_node_idx_in_path -= 1
 
-    def _is_node_underflowing(self, node: BTreeNode) -> bool:
-        """Checks if the given node is underflowed
-
-        An underflowed node is a node whose number of keys is just one less than
-        the required minimum number of keys.
-
-        Parameters
-        ----------
-        node : BTreeNode
-            The node to check out
-
-        Returns
-        -------
-        bool
-            `True` if the node is underflowing; otherwise, `False`
-        """
-        if node is self.root:
-            return False
-        return len(node.keys) < (self.order - 1) // 2
-
-    def _is_node_populous(self, node: BTreeNode) -> bool:
-        """Checks if the given node is underflowed
-
-        An populous node is a node whose number of keys is just two or more than
-        the required minimum number of keys.
-
-        Parameters
-        ----------
-        node : BTreeNode
-            The node to check out
-
-        Returns
-        -------
-        bool
-            `True` if the node is populous; otherwise, `False`
-        """
-        if node is self.root:
-            return False
-        return len(node.keys) >= (self.order - 1) // 2 + 1
+        # the root is replaced by its only child once it runs out of keys
+        if len(self.root.children) == 1:
+            self.root = self.root.children[0]
@@ -0,0 +1,583 @@
+"""This module provides a Numba-accelerated implementation of a B-Tree.
+
+Unlike `BTree` (see b_tree.py), which stores arbitrary Python objects in lists,
+`BTreeNumeric` only stores numeric keys (e.g. int64/float64). Its nodes live in
+a pre-allocated pool of NumPy arrays and are addressed by integer ids, so the
+hot per-node loops can be compiled by Numba. See refs/btree.md for
+reference/more details.
+"""
+from typing import Any, Generator, NamedTuple, Optional
+
+import numba
+import numpy as np
+
+from .b_tree import BTree
+
+# marks the absence of a child; a node whose first child is `_NO_CHILD` is a
+# leaf
+_NO_CHILD = -1
+
+# an upper bound of the height of any tree that fits in memory. used to size
+# the path buffers of the compiled routines
+_MAX_HEIGHT = 64
+
+
+class _NodePool(NamedTuple):
+    """Stores the state of every node of a `BTreeNumeric`
+
+    Row `i` of each array belongs to the node whose id is `i`. Each node has
+    room for one extra key and one extra child, so that it can overflow before
+    being split.
+
+    Attributes
+    ----------
+    keys : numpy.ndarray
+        A 2D array of shape (capacity, order) of the nodes' keys
+    n_keys : numpy.ndarray
+        A 1D array of shape (capacity,) of the nodes' number of keys
+    children_ids : numpy.ndarray
+        A 2D array of shape (capacity, order + 1) of the ids of the nodes'
+        children
+    """
+    keys: np.ndarray
+    n_keys: np.ndarray
+    children_ids: np.ndarray
+
+
+@numba.njit(cache=True)
+def _search_node(keys, n, target):
+    """Returns the index of the first of the first `n` keys that is not less
+    than `target`
+    """
+    return np.searchsorted(keys[:n], target)
+
+
+@numba.njit(cache=True)
+def _insert_key(row, n, idx, value):
+    """Inserts `value` at index `idx` of the first `n` items of `row`, shifting
+    the items from `idx` onwards one position to the right
+    """
+    # a single (overlapping) slice move rather than an item-by-item shift
+    row[(idx+1):(n+1)] = row[idx:n]
+    row[idx] = value
+
+
+@numba.njit(cache=True)
+def _remove_key(row, n, idx):
+    """Removes the item at index `idx` of the first `n` items of `row`, shifting
+    the items after it one position to the left
+    """
+    row[idx:(n-1)] = row[(idx+1):n]
+
+
+@numba.njit(cache=True)
+def _allocate_node(free_ids, n_free, n_nodes):
+    """Allocates a node, reusing the most recently freed one if there's any
+
+    Returns
+    -------
+    tuple of int
+        The id of the node, and the new number of free nodes and of nodes in
+        use
+    """
+    if n_free > 0:
+        return free_ids[n_free - 1], n_free - 1, n_nodes
+    return n_nodes, n_free, n_nodes + 1
+
+
+@numba.njit(cache=True, boundscheck=False)
+def _split_node(keys, n_keys, children_ids, node_id, right_id, mid):
+    """Splits the node `node_id` around its key at index `mid`
+
+    The keys (and children) to the right of the middle key are moved to the
+    node `right_id`, whereas the ones to its left stay in `node_id`.
+
+    Returns
+    -------
+    key
+        The middle key, which should be moved to the parent
+    """
+    n = n_keys[node_id]
+    n_right = n - mid - 1
+    keys[right_id, :n_right] = keys[node_id, (mid+1):n]
+    if children_ids[node_id, 0] == _NO_CHILD:
+        children_ids[right_id, 0] = _NO_CHILD
+    else:
+        children_ids[right_id, :(n_right+1)] = \
+            children_ids[node_id, (mid+1):(n+1)]
+    n_keys[right_id] = n_right
+    n_keys[node_id] = mid
+    return keys[node_id, mid]
+
+
+@numba.njit(cache=True)
+def _search(keys, n_keys, children_ids, root_id, target):
+    """Checks if `target` is in the tree rooted at the node `root_id`"""
+    node_id = root_id
+    while node_id != _NO_CHILD:
+        n = n_keys[node_id]
+        idx = _search_node(keys[node_id], n, target)
+        if idx < n and keys[node_id, idx] == target:
+            return True
+        if children_ids[node_id, 0] == _NO_CHILD:
+            return False
+        node_id = children_ids[node_id, idx]
+    return False
+
+
+@numba.njit(cache=True, boundscheck=False)
+def _merge_siblings(keys, n_keys, children_ids, left_id, right_id, pivot):
+    """Merges the node `right_id`, and the key `pivot` between it and its left
+    sibling `left_id`, into the latter
+
+    Returns
+    -------
+    int
+        The number of keys of the merged node
+    """
+    n_left = n_keys[left_id]
+    n_right = n_keys[right_id]
+    keys[left_id, n_left] = pivot
+    keys[left_id, (n_left+1):(n_left+1+n_right)] = keys[right_id, :n_right]
+    if children_ids[left_id, 0] != _NO_CHILD:
+        children_ids[left_id, (n_left+1):(n_left+2+n_right)] = \
+            children_ids[right_id, :(n_right+1)]
+    n_keys[left_id] = n_left + 1 + n_right
+    return n_keys[left_id]
+
+
+@numba.njit(cache=True, boundscheck=False)
+def _borrow(keys, n_keys, children_ids, left_id, right_id, pivot, from_left):
+    """Rotates a key (and a child) between the adjacent siblings `left_id` and
+    `right_id` through the key `pivot` between them
+
+    If `from_left` is `True`, the last key of the left sibling moves up and
+    `pivot` moves to the front of the right sibling. Otherwise, the first key
+    of the right sibling moves up and `pivot` moves to the end of the left
+    sibling.
+
+    Returns
+    -------
+    key
+        The key that should replace `pivot` in the parent
+    """
+    n_left = n_keys[left_id]
+    n_right = n_keys[right_id]
+    internal = children_ids[left_id, 0] != _NO_CHILD
+    if from_left:
+        new_pivot = keys[left_id, n_left - 1]
+        _insert_key(keys[right_id], n_right, 0, pivot)
+        if internal:
+            _insert_key(children_ids[right_id], n_right + 1, 0,
+                        children_ids[left_id, n_left])
+        n_keys[left_id] = n_left - 1
+        n_keys[right_id] = n_right + 1
+    else:
+        new_pivot = keys[right_id, 0]
+        keys[left_id, n_left] = pivot
+        _remove_key(keys[right_id], n_right, 0)
+        if internal:
+            children_ids[left_id, n_left + 1] = children_ids[right_id, 0]
+            _remove_key(children_ids[right_id], n_right + 1, 0)
+        n_keys[left_id] = n_left + 1
+        n_keys[right_id] = n_right - 1
+    return new_pivot
+
+
+@numba.njit(cache=True)
+def _insert(keys, n_keys, children_ids, free_ids, root_id, n_nodes, n_free, key):
+    """Inserts `key` into the (non-empty) tree rooted at the node `root_id`
+
+    New nodes are taken from `free_ids` first, then from id `n_nodes` onwards;
+    the caller must ensure the pool has room for at least `_MAX_HEIGHT` new
+    nodes.
+
+    Returns
+    -------
+    tuple of int
+        The id of the (possibly new) root, and the new number of nodes in use
+        and of free nodes
+    """
+    order = keys.shape[1]
+    path_ids = np.empty(_MAX_HEIGHT, np.int64)
+    path_idxs = np.empty(_MAX_HEIGHT, np.int64)
+
+    depth = 0
+    node_id = root_id
+    while True:
+        idx = _search_node(keys[node_id], n_keys[node_id], key)
+        path_ids[depth] = node_id
+        path_idxs[depth] = idx
+        if children_ids[node_id, 0] == _NO_CHILD:
+            break
+        node_id = children_ids[node_id, idx]
+        depth += 1
+
+    _insert_key(keys[node_id], n_keys[node_id], idx, key)
+    n_keys[node_id] += 1
+
+    mid = (order - 1) // 2
+    while n_keys[path_ids[depth]] > order - 1:
+        node_id = path_ids[depth]
+        right_id, n_free, n_nodes = _allocate_node(free_ids, n_free, n_nodes)
+        pivot = _split_node(keys, n_keys, children_ids, node_id, right_id, mid)
+
+        if depth == 0:
+            root_id, n_free, n_nodes = _allocate_node(free_ids, n_free, n_nodes)
+            keys[root_id, 0] = pivot
+            n_keys[root_id] = 1
+            children_ids[root_id, 0] = node_id
+            children_ids[root_id, 1] = right_id
+            break
+
+        depth -= 1
+        parent_id = path_ids[depth]
+        idx = path_idxs[depth]
+        n = n_keys[parent_id]
+        _insert_key(keys[parent_id], n, idx, pivot)
+        _insert_key(children_ids[parent_id], n + 1, idx + 1, right_id)
+        n_keys[parent_id] = n + 1
+
+    return root_id, n_nodes, n_free
+
+
+@numba.njit(cache=True)
+def _remove(keys, n_keys, children_ids, free_ids, root_id, n_free, key):
+    """Removes `key` from the (non-empty) tree rooted at the node `root_id`
+
+    Nodes merged into their siblings are pushed onto `free_ids`.
+
+    Returns
+    -------
+    tuple
+        The id of the (possibly new) root, the new number of free nodes and
+        whether `key` was found
+    """
+    order = keys.shape[1]
+    min_keys = (order - 1) // 2
+    path_ids = np.empty(_MAX_HEIGHT, np.int64)
+    # the index of each node in its parent's children
+    path_idxs = np.empty(_MAX_HEIGHT, np.int64)
+
+    # the descent looks for the key and -- once it's found in an internal
+    # node -- carries on to the leaf holding its successor
+    target_id = _NO_CHILD
+    target_idx = 0
+    depth = 0
+    node_id = root_id
+    path_ids[0] = root_id
+    path_idxs[0] = _NO_CHILD
+    while True:
+        if target_id == _NO_CHILD:
+            n = n_keys[node_id]
+            idx = _search_node(keys[node_id], n, key)
+            if idx < n and keys[node_id, idx] == key:
+                target_id = node_id
+                target_idx = idx
+                idx += 1
+        else:
+            idx = 0
+        if children_ids[node_id, 0] == _NO_CHILD:
+            break
+        node_id = children_ids[node_id, idx]
+        depth += 1
+        path_ids[depth] = node_id
+        path_idxs[depth] = idx
+
+    if target_id == _NO_CHILD:
+        return root_id, n_free, False
+
+    if target_id != node_id:
+        keys[target_id, target_idx] = keys[node_id, 0]
+        target_idx = 0
+    _remove_key(keys[node_id], n_keys[node_id], target_idx)
+    n_keys[node_id] -= 1
+
+    while depth > 0:
+        node_id = path_ids[depth]
+        if n_keys[node_id] >= min_keys:
+            return root_id, n_free, True
+
+        parent_id = path_ids[depth - 1]
+        idx = path_idxs[depth]
+        if idx > 0:
+            left_id = children_ids[parent_id, idx - 1]
+            if n_keys[left_id] > min_keys:
+                keys[parent_id, idx - 1] = _borrow(
+                    keys, n_keys, children_ids, left_id, node_id,
+                    keys[parent_id, idx - 1], True)
+                return root_id, n_free, True
+        if idx < n_keys[parent_id]:
+            right_id = children_ids[parent_id, idx + 1]
+            if n_keys[right_id] > min_keys:
+                keys[parent_id, idx] = _borrow(
+                    keys, n_keys, children_ids, node_id, right_id,
+                    keys[parent_id, idx], False)
+                return root_id, n_free, True
+
+        # merge with the left sibling if there's no right sibling; otherwise,
+        # with the right sibling
+        if idx == n_keys[parent_id]:
+            idx -= 1
+        left_id = children_ids[parent_id, idx]
+        right_id = children_ids[parent_id, idx + 1]
+        _merge_siblings(keys, n_keys, children_ids, left_id, right_id,
+                        keys[parent_id, idx])
+        n = n_keys[parent_id]
+        _remove_key(keys[parent_id], n, idx)
+        _remove_key(children_ids[parent_id], n + 1, idx + 1)
+        n_keys[parent_id] = n - 1
+        free_ids[n_free] = right_id
+        n_free += 1
+        depth -= 1
+
+    # the root is replaced by its only child once it runs out of keys
+    if n_keys[root_id] == 0 and children_ids[root_id, 0] != _NO_CHILD:
+        free_ids[n_free] = root_id
+        n_free += 1
+        root_id = children_ids[root_id, 0]
+    return root_id, n_free, True
+
+
+@numba.njit(cache=True)
+def _traverse_inorder(keys, n_keys, children_ids, root_id, out):
+    """Writes the keys of the tree rooted at the node `root_id` into `out` in
+    ascending order
+
+    Returns
+    -------
+    int
+        The number of keys written
+    """
+    stack_ids = np.empty(_MAX_HEIGHT, np.int64)
+    # the index of the next child to visit of each node in the stack
+    stack_idxs = np.empty(_MAX_HEIGHT, np.int64)
+    top = 0
+    stack_ids[0] = root_id
+    stack_idxs[0] = 0
+    n_out = 0
+    while top >= 0:
+        node_id = stack_ids[top]
+        i = stack_idxs[top]
+        n = n_keys[node_id]
+        if children_ids[node_id, 0] == _NO_CHILD:
+            out[n_out:(n_out+n)] = keys[node_id, :n]
+            n_out += n
+            top -= 1
+            continue
+        if i > n:
+            top -= 1
+            continue
+        if i > 0:
+            out[n_out] = keys[node_id, i - 1]
+            n_out += 1
+        stack_idxs[top] = i + 1
+        top += 1
+        stack_ids[top] = children_ids[node_id, i]
+        stack_idxs[top] = 0
+    return n_out
+
+
+class BTreeNumeric:
+    """Represents a B-Tree of numeric keys
+
+    This implementation of B-Trees support even orders, which isn't in the
+    original specification
+
+    Attributes
+    ----------
+    order : int
+        Represents the order of the B-Tree. Defaults to the order
+        `BTree.recommended_order` suggests for keys of type `dtype`
+    dtype : numpy.dtype
+        The data type of the keys
+    size : int
+        The number of keys in the B-Tree
+    """
+
+    def __init__(self, order: Optional[int] = None, dtype: Any = np.int64,
+                 capacity: int = 1024):
+        self.dtype = np.dtype(dtype)
+        self.order = order if order is not None \
+            else BTree.recommended_order(self.dtype.itemsize)
+        self.size = 0
+        self._root_id = _NO_CHILD
+        self._n_nodes = 0
+        self._pool = self._allocate_pool(max(capacity, _MAX_HEIGHT + 1))
+        # a stack of the ids of the nodes freed by removals
+        self._free_ids = np.empty(len(self._pool.n_keys), dtype=np.int64)
+        self._n_free = 0
+
+    def _allocate_pool(self, capacity: int) -> _NodePool:
+        """Allocates a pool with room for `capacity` nodes
+
+        Parameters
+        ----------
+        capacity : int
+            The number of nodes the pool can hold
+
+        Returns
+        -------
+        _NodePool
+            The new pool, with the nodes currently in use copied into it
+        """
+        pool = _NodePool(
+            np.empty((capacity, self.order), dtype=self.dtype),
+            np.zeros(capacity, dtype=np.int64),
+            np.full((capacity, self.order + 1), _NO_CHILD, dtype=np.int64))
+        if self._n_nodes:
+            for new, old in zip(pool, self._pool):
+                new[:self._n_nodes] = old[:self._n_nodes]
+        return pool
+
+    def _reserve(self) -> None:
+        """Grows the pool, if needed, so that an insertion can't run out of
+        nodes
+        """
+        capacity = len(self._pool.n_keys)
+        if self._n_nodes + _MAX_HEIGHT > capacity:
+            self._pool = self._allocate_pool(2 * capacity)
+            free_ids = np.empty(2 * capacity, dtype=np.int64)
+            free_ids[:self._n_free] = self._free_ids[:self._n_free]
+            self._free_ids = free_ids
+
+    def traverse_inorder(self) -> Generator[Any, None, None]:
+        """Returns the inorder traversal of the B-Tree
+
+        Yields
+        -------
+        keys
+            The inorder traversal
+        """
+        yield from self.traverse_inorder_list()
+
+    def traverse_inorder_list(self) -> list[Any]:
+        """Returns the inorder traversal of the B-Tree as a list
+
+        Returns
+        -------
+        list
+            The inorder traversal
+        """
+        if self._root_id == _NO_CHILD:
+            return []
+        out = np.empty(self.size, dtype=self.dtype)
+        _traverse_inorder(*self._pool, self._root_id, out)
+        return out.tolist()
+
+    def _to_key(self, key: Any) -> Any:
+        """Converts `key` to the data type of the B-Tree's keys
+
+        Parameters
+        ----------
+        key : int or float
+            The key to be converted
+
+        Returns
+        -------
+        numpy scalar
+            The converted key
+
+        Raises
+        ------
+        ValueError
+            If `key` can't be represented exactly by `dtype` (e.g. a
+            non-integral float given to an int64 B-Tree, an int too large for
+            a float64 B-Tree to hold exactly, or a key out of `dtype`'s range)
+            or if `key` is NaN
+        """
+        # NaN is the only value that isn't equal to itself
+        if key != key:
+            raise ValueError(
+                "Attempted to use key `nan`, which can't be ordered")
+        try:
+            converted = self.dtype.type(key)
+        except (OverflowError, TypeError) as e:
+            raise ValueError(
+                f"Key `{key}` can't be represented as {self.dtype}") from e
+        # compared as Python numbers; comparing the NumPy scalar with `key`
+        # would first convert `key` to `dtype`, hiding any rounding
+        if converted.item() != key:
+            raise ValueError(
+                f"Key `{key}` can't be represented exactly as {self.dtype}")
+        return converted
+
+    def search(self, target: Any) -> bool:
+        """Searches for a key in a B-Tree
+
+        Parameters
+        ----------
+        target : int or float
+            The key to search for
+
+        Returns
+        -------
+        bool
+            `True` if the key exists in the B-Tree; otherwise, `False`
+
+        Raises
+        ------
+        ValueError
+            If `target` is `None` or can't be represented exactly by `dtype`
+        """
+        if target is None:
+            raise ValueError("Attempted to search for key `None`")
+
+        return bool(_search(*self._pool, self._root_id,
+                            self._to_key(target)))
+
+    def insert(self, key: Any) -> None:
+        """Inserts a key into the B-Tree
+
+        Parameters
+        ----------
+        key : int or float
+            The key to be inserted
+
+        Raises
+        ------
+        ValueError
+            If `key` is `None` or can't be represented exactly by `dtype`
+        """
+        if key is None:
+            raise ValueError("Attempted to insert key `None`")
+
+        key = self._to_key(key)
+        if self._root_id == _NO_CHILD:
+            self._root_id = self._n_nodes
+            self._pool.keys[self._root_id, 0] = key
+            self._pool.n_keys[self._root_id] = 1
+            self._n_nodes += 1
+        else:
+            self._reserve()
+            self._root_id, self._n_nodes, self._n_free = _insert(
+                *self._pool, self._free_ids, self._root_id, self._n_nodes,
+                self._n_free, key)
+        self.size += 1
+
+    def remove(self, key: Any) -> None:
+        """Removes a key from the B-Tree
+
+        Parameters
+        ----------
+        key : int or float
+            The key to be removed
+
+        Raises
+        ------
+        ValueError
+            If `key` is `None`, can't be represented exactly by `dtype` or
+            isn't in the B-Tree
+        """
+        if key is None:
+            raise ValueError("Attempted to remove key `None`")
+
+        converted = self._to_key(key)
+        found = False
+        if self._root_id != _NO_CHILD:
+            self._root_id, self._n_free, found = _remove(
+                *self._pool, self._free_ids, self._root_id, self._n_free,
+                converted)
+        if not found:
+            raise ValueError(f"Attempted to remove a non-existing key `{key}`")
+        self.size -= 1
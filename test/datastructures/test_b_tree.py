@@ -12,6 +12,64 @@ def test_tree_initialization():
     assert tree.root is None
 
 
+def test_tree_initialization_with_default_order():
+    tree = BTree()
+
+    assert tree.order == BTree.recommended_order()
+    assert tree.root is None
+
+
+def test_recommended_order():
+    assert BTree.recommended_order() == 64
+    assert BTree.recommended_order(key_size_bytes=24) == 32
+    assert BTree.recommended_order(node_target_bytes=16) == 3
+
+
+@pytest.mark.parametrize('order', [3,4,5,6])
+def test_reassigning_root(order):
+    tree = BTree(order)
+    for k in range(100):
+        tree.insert(k)
+
+    # a deeper tree
+    tree.root = BTree.bulk_load(range(1000), order).root
+    tree.remove(0)
+    tree.insert(1000)
+    assert tree.traverse_inorder_list() == list(range(1, 1001))
+    _BTreeAssert.assert_btree_properties(tree)
+
+    # a shallower tree
+    tree.root = BTreeNode([1, 2])
+    tree.remove(1)
+    tree.insert(3)
+    assert tree.traverse_inorder_list() == [2, 3]
+    _BTreeAssert.assert_btree_properties(tree)
+
+
+@pytest.mark.parametrize('order', [3,4,5,6])
+def test_insert_after_reassigning_root(order):
+    tree = BTree(order)
+    for k in range(100):
+        tree.insert(k)
+
+    # the last inserted-into leaf isn't in the new tree
+    tree.root = BTree.bulk_load(range(1000), order).root
+    tree.insert(1000)
+    assert tree.traverse_inorder_list() == list(range(1001))
+    _BTreeAssert.assert_btree_properties(tree)
+
+    tree.root = BTreeNode([1, 2])
+    tree.insert(1001)
+    assert tree.traverse_inorder_list() == [1, 2, 1001]
+    _BTreeAssert.assert_btree_properties(tree)
+
+
+def test_node_has_no_instance_dict():
+    node = BTreeNode([1], [])
+
+    assert not hasattr(node, '__dict__')
+
+
 def test_btree_traversal():
     random.seed(_SEED_RANDOM)
     keys = list(range(1000))
@@ -25,6 +83,20 @@ def test_btree_traversal():
     for k in tree.traverse_inorder():
         assert prev is None or k > prev
         prev = k
+    assert list(tree.traverse_inorder()) == sorted(keys)
+
+
+def test_btree_traversal_list():
+    random.seed(_SEED_RANDOM)
+    keys = list(range(1000))
+    random.shuffle(keys)
+
+    tree = BTree(11)
+    assert tree.traverse_inorder_list() == []
+    for k in keys:
+        tree.insert(k)
+
+    assert tree.traverse_inorder_list() == sorted(keys)
 
 
 def test_btree_search():
@@ -40,6 +112,60 @@ def test_btree_search():
         assert k in tree.search(k).keys
 
 
+def test_btree_search_non_existing_key():
+    tree = BTree(5)
+    for k in range(0, 100, 2):
+        tree.insert(k)
+
+    assert tree.search(-1) is None
+    assert tree.search(51) is None
+    assert tree.search(100) is None
+
+
+class TestBTreeBulkLoad:
+    KEYS_COUNTS_TO_TEST = [1, 2, 3, 5, 16, 17, 18, 100, 289, 1000, 4097]
+
+    def test_bulk_load_no_keys(self):
+        tree = BTree.bulk_load([], 5)
+
+        assert tree.order == 5
+        assert tree.root is None
+
+    def test_bulk_load_null_key(self):
+        with pytest.raises(ValueError):
+            BTree.bulk_load([None], 5)
+        with pytest.raises(ValueError):
+            BTree.bulk_load([1, None], 5)
+        with pytest.raises(ValueError):
+            BTree.bulk_load(iter([3, None, 1]), 5)
+
+    @pytest.mark.parametrize('order', _ORDERS_TO_TEST)
+    @pytest.mark.parametrize('keys_count', KEYS_COUNTS_TO_TEST)
+    def test_bulk_load(self, order, keys_count):
+        keys = list(range(keys_count))
+        random.seed(_SEED_RANDOM)
+        random.shuffle(keys)
+
+        tree = BTree.bulk_load(keys, order)
+
+        assert list(tree.traverse_inorder()) == sorted(keys)
+        _BTreeAssert.assert_btree_properties(tree)
+        _BTreeAssert.assert_min_keys_count(tree.root, tree)
+
+    @pytest.mark.parametrize('order', [3,4,5,6])
+    def test_bulk_loaded_tree_supports_inserts_and_removals(self, order):
+        tree = BTree.bulk_load(range(0, 1000, 2), order)
+
+        for k in range(1, 1000, 2):
+            tree.insert(k)
+        for k in range(0, 1000, 4):
+            tree.remove(k)
+
+        assert list(tree.traverse_inorder()) == \
+            [k for k in range(1000) if k % 4 != 0]
+        _BTreeAssert.assert_btree_properties(tree)
+
+
 class TestBTreeInsert:
     KEYS_COUNT_FOR_BULK_INSERT_TEST = 1 << 16 - 1
 
@@ -183,6 +309,89 @@ class TestBTreeInsert:
 
         _BTreeAssert.assert_btree_properties(tree)
 
+    @pytest.mark.parametrize('order', _ORDERS_TO_TEST)
+    def test_clustered_inserts(self, order):
+        # Inserts runs of ascending/descending keys, which mostly land on the
+        # leaf the previous key was inserted into
+        tree = BTree(order)
+        keys = list(range(0, 3000, 3)) + list(range(2999, 0, -3)) \
+            + list(range(1, 3000, 3))
+
+        for k in keys:
+            tree.insert(k)
+
+        assert list(tree.traverse_inorder()) == list(range(3000))
+        _BTreeAssert.assert_btree_properties(tree)
+
+    @pytest.mark.parametrize('order', [3,4,5,6])
+    def test_clustered_inserts_interleaved_with_removals(self, order):
+        tree = BTree(order)
+        for k in range(0, 2000, 2):
+            tree.insert(k)
+
+        for k in range(0, 2000, 4):
+            tree.remove(k)
+            tree.insert(k + 1)
+
+        assert list(tree.traverse_inorder()) == \
+            sorted(list(range(2, 2000, 4)) + list(range(1, 2000, 4)))
+        _BTreeAssert.assert_btree_properties(tree)
+
+
+class TestBTreeInsertMany:
+    def test_insert_many_into_empty_tree(self):
+        tree = BTree(5)
+
+        tree.insert_many([3, 1, 2])
+
+        assert list(tree.traverse_inorder()) == [1, 2, 3]
+        _BTreeAssert.assert_btree_properties(tree)
+
+    def test_insert_many_null_key(self):
+        tree = BTree(5)
+        tree.insert(1)
+
+        with pytest.raises(ValueError):
+            tree.insert_many([None])
+        with pytest.raises(ValueError):
+            tree.insert_many([2, None])
+        assert list(tree.traverse_inorder()) == [1]
+
+        empty_tree = BTree(5)
+        with pytest.raises(ValueError):
+            empty_tree.insert_many([2, None, 0])
+        assert empty_tree.root is None
+
+    @pytest.mark.parametrize('order', _ORDERS_TO_TEST)
+    def test_insert_many_into_existing_tree(self, order):
+        random.seed(_SEED_RANDOM)
+        keys = list(range(3000))
+        random.shuffle(keys)
+        tree = BTree(order)
+        for k in keys[:1000]:
+            tree.insert(k)
+
+        tree.insert_many(keys[1000:2000])
+        tree.insert_many(iter(keys[2000:]))
+
+        assert list(tree.traverse_inorder()) == list(range(3000))
+        _BTreeAssert.assert_btree_properties(tree)
+
+    @pytest.mark.parametrize('order', [3,4,5,6])
+    def test_insert_many_interleaved_with_single_inserts_and_removals(self, order):
+        tree = BTree(order)
+        tree.insert_many(range(0, 2000, 4))
+        tree.insert_many(range(1, 2000, 4))
+        for k in range(2, 2000, 4):
+            tree.insert(k)
+        for k in range(0, 2000, 8):
+            tree.remove(k)
+        tree.insert_many(range(3, 2000, 4))
+
+        assert list(tree.traverse_inorder()) == \
+            [k for k in range(2000) if k % 8 != 0]
+        _BTreeAssert.assert_btree_properties(tree)
+
 
 class TestBTreeRemove:
     KEYS_COUNT_IN_TREE_IN_BULK_REMOVAL_TEST = 1 << 16 - 1
@@ -262,7 +471,19 @@ class TestBTreeRemove:
         _BTreeAssert.assert_btree_properties(tree)
 
     def test_removal_fixes_once_by_borrowing_in_tree_of_height_1(self):
-        ...
+        tree = BTree(5)
+        for i in range(1, 10):
+            tree.insert(i)
+
+        tree.remove(4)
+
+        root = tree.root
+        assert root.keys == [3,7]
+        assert len(root.children) == 3
+        assert root.children[0].keys == [1,2]
+        assert root.children[1].keys == [5,6]
+        assert root.children[2].keys == [8,9]
+        _BTreeAssert.assert_btree_properties(tree)
 
     def test_removal_fixes_twice_by_borrowing_in_tree_of_height_2(self):
         ...
@@ -303,10 +524,55 @@ class _BTreeAssert:
     def assert_btree_properties(tree):
         """Validates properties of a B-Tree
         """
-        _BTreeAssert.assert_ordered_keys(tree.root)
-        _BTreeAssert.assert_count_keys_and_children(tree.root, tree)
-        _BTreeAssert.assert_descandants_keys_range(tree.root)
-        _BTreeAssert.assert_leaves_level_equal(tree.root)
+        _BTreeAssert.assert_btree_properties_fast(tree)
+
+    @staticmethod
+    def assert_btree_properties_fast(tree):
+        """Validates properties of a B-Tree in a single pass over all nodes
+
+        This method asserts what `assert_ordered_keys`,
+        `assert_count_keys_and_children`, `assert_descandants_keys_range` and
+        `assert_leaves_level_equal` assert, all in one iterative in-order
+        traversal:
+        - Every key is no less than the key preceding it in the traversal,
+          which implies the keys of every node are ordered and within the range
+          its ancestors' keys bound it to
+        - The keys/children count of every node are correct
+        - All leaves are at the same depth
+        """
+        if tree.root is None:
+            return
+
+        prev_key = None
+        leaves_depths = set()
+        # each item is a node, the idx of its next child to visit and its depth
+        stack = [(tree.root, 0, 0)]
+        while stack:
+            node, child_idx, depth = stack.pop()
+            if child_idx == 0:
+                assert len(node.keys) < tree.order
+                assert len(node.children) <= tree.order
+
+            if not node.children:
+                leaves_depths.add(depth)
+                for key in node.keys:
+                    assert prev_key is None or prev_key <= key
+                    prev_key = key
+                continue
+
+            if child_idx == 0:
+                assert len(node.children) - len(node.keys) == 1
+            else:
+                key = node.keys[child_idx - 1]
+                assert prev_key is None or prev_key <= key
+                prev_key = key
+            if child_idx < len(node.keys):
+                stack.append((node, child_idx + 1, depth))
+            stack.append((node.children[child_idx], 0, depth + 1))
+
+        assert len(leaves_depths) == 1
+        # the tree keeps track of its height
+        assert leaves_depths == {tree._height}
 
     @staticmethod
     def assert_count_keys_and_children(node: BTreeNode, tree: BTree):
@@ -326,6 +592,17 @@ class _BTreeAssert:
         for c in node.children:
             _BTreeAssert.assert_count_keys_and_children(c, tree)
 
+    @staticmethod
+    def assert_min_keys_count(node: BTreeNode, tree: BTree):
+        """Asserts all nodes (in the subtree rooted at the given node) other
+        than the root have at least the minimum number of keys
+        """
+        if node is not tree.root:
+            assert len(node.keys) >= (tree.order - 1) // 2
+
+        for c in node.children:
+            _BTreeAssert.assert_min_keys_count(c, tree)
+
     @staticmethod
     def assert_leaves_level_equal(node: BTreeNode):
         """Asserts all leaves (in the subtree rooted at the given node) are at
@@ -0,0 +1,235 @@
+import random
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('numba')
+
+from algosdatastructures.src.datastructures.b_tree_numba import BTreeNumeric
+
+_SEED_RANDOM = 1
+_ORDERS_TO_TEST = list(range(3,18))
+
+
+def test_tree_initialization():
+    tree = BTreeNumeric(3)
+
+    assert tree.size == 0
+    assert list(tree.traverse_inorder()) == []
+    assert not tree.search(1)
+
+
+def test_tree_initialization_with_default_order():
+    assert BTreeNumeric().order == 64
+    assert BTreeNumeric(dtype=np.int32).order == 85
+
+
+def test_null_insertion_into_empty_tree():
+    tree = BTreeNumeric(5)
+
+    with pytest.raises(ValueError):
+        tree.insert(None)
+    assert tree.size == 0
+
+
+@pytest.mark.parametrize('order', _ORDERS_TO_TEST)
+def test_bulk_inserts(order):
+    tree = BTreeNumeric(order, capacity=16)
+    keys = list(range(1 << 12))
+    random.seed(_SEED_RANDOM)
+    random.shuffle(keys)
+
+    for k in keys:
+        tree.insert(k)
+
+    assert tree.size == len(keys)
+    assert list(tree.traverse_inorder()) == sorted(keys)
+    assert tree.traverse_inorder_list() == sorted(keys)
+    _BTreeNumericAssert.assert_btree_properties(tree)
+
+
+def test_search():
+    tree = BTreeNumeric(11)
+    for k in range(0, 2000, 2):
+        tree.insert(k)
+
+    for k in range(0, 2000, 2):
+        assert tree.search(k)
+    for k in range(-1, 2001, 2):
+        assert not tree.search(k)
+
+
+def test_non_integral_float_keys_in_int_tree():
+    tree = BTreeNumeric(5)
+    for k in range(10):
+        tree.insert(k)
+
+    with pytest.raises(ValueError):
+        tree.search(3.5)
+    with pytest.raises(ValueError):
+        tree.insert(2.7)
+    assert tree.size == 10
+    assert tree.traverse_inorder_list() == list(range(10))
+
+    # integral floats are represented exactly
+    assert tree.search(3.0)
+    tree.insert(10.0)
+    assert tree.traverse_inorder_list() == list(range(11))
+
+
+def test_large_int_key_in_float_tree():
+    tree = BTreeNumeric(5, dtype=np.float64)
+    tree.insert(2**53)
+
+    # 2**53 + 1 would be rounded to 2**53
+    with pytest.raises(ValueError):
+        tree.insert(2**53 + 1)
+    with pytest.raises(ValueError):
+        tree.search(2**53 + 1)
+    with pytest.raises(ValueError):
+        tree.remove(2**53 + 1)
+
+    assert tree.size == 1
+    assert tree.traverse_inorder_list() == [2**53]
+
+
+def test_out_of_range_keys():
+    tree = BTreeNumeric(5)
+    with pytest.raises(ValueError):
+        tree.insert(2**63)
+    with pytest.raises(ValueError):
+        tree.insert(float('inf'))
+    with pytest.raises(ValueError):
+        tree.insert(1j)
+    with pytest.raises(ValueError):
+        BTreeNumeric(5, dtype=np.int32).insert(2**40)
+    assert tree.size == 0
+
+
+def test_nan_key():
+    tree = BTreeNumeric(5, dtype=np.float64)
+    tree.insert(1.0)
+
+    for method in (tree.insert, tree.search, tree.remove):
+        with pytest.raises(ValueError, match="can't be ordered"):
+            method(float('nan'))
+        with pytest.raises(ValueError, match="can't be ordered"):
+            method(np.nan)
+    assert tree.traverse_inorder_list() == [1.0]
+
+
+def test_float_keys():
+    random.seed(_SEED_RANDOM)
+    keys = [random.random() for _ in range(1000)]
+    tree = BTreeNumeric(7, dtype=np.float64)
+
+    for k in keys:
+        tree.insert(k)
+
+    assert list(tree.traverse_inorder()) == sorted(keys)
+    assert all(tree.search(k) for k in keys)
+    _BTreeNumericAssert.assert_btree_properties(tree)
+
+
+def test_null_removal():
+    tree = BTreeNumeric(5)
+    for i in range(4):
+        tree.insert(i)
+
+    with pytest.raises(ValueError):
+        tree.remove(None)
+
+
+def test_remove_non_existing_key():
+    tree = BTreeNumeric(7)
+    with pytest.raises(ValueError):
+        tree.remove(9)
+
+    for i in range(0, 100, 2):
+        tree.insert(i)
+    with pytest.raises(ValueError):
+        tree.remove(9)
+    assert tree.size == 50
+
+
+def test_remove_non_integral_float_key_from_int_tree():
+    tree = BTreeNumeric(5)
+    for k in range(10):
+        tree.insert(k)
+
+    with pytest.raises(ValueError):
+        tree.remove(3.5)
+    with pytest.raises(ValueError):
+        tree.remove(3.9)
+
+    assert tree.size == 10
+    assert tree.traverse_inorder_list() == list(range(10))
+    _BTreeNumericAssert.assert_btree_properties(tree)
+
+
+@pytest.mark.parametrize('order', _ORDERS_TO_TEST)
+def test_bulk_removal(order):
+    tree = BTreeNumeric(order)
+    keys = list(range(1 << 12))
+    random.seed(_SEED_RANDOM)
+    random.shuffle(keys)
+    for k in keys:
+        tree.insert(k)
+
+    keys_to_remove = random.sample(keys, len(keys) // 2)
+    for i, k in enumerate(keys_to_remove):
+        tree.remove(k)
+        if i % 64 == 0:
+            _BTreeNumericAssert.assert_btree_properties(tree)
+
+    assert tree.size == len(keys) - len(keys_to_remove)
+    assert list(tree.traverse_inorder()) == \
+        sorted(set(keys) - set(keys_to_remove))
+    _BTreeNumericAssert.assert_btree_properties(tree)
+
+
+@pytest.mark.parametrize('order', [3,4,5,6])
+def test_remove_all_then_reinsert_reuses_nodes(order):
+    tree = BTreeNumeric(order)
+    keys = list(range(1000))
+    for k in keys:
+        tree.insert(k)
+    n_nodes = tree._n_nodes
+
+    for k in keys:
+        tree.remove(k)
+    assert tree.size == 0
+    assert list(tree.traverse_inorder()) == []
+
+    for k in reversed(keys):
+        tree.insert(k)
+    assert list(tree.traverse_inorder()) == keys
+    assert tree._n_nodes <= n_nodes
+    _BTreeNumericAssert.assert_btree_properties(tree)
+
+
+class _BTreeNumericAssert:
+    """Provides static methods for asserting various properties of B-trees
+    """
+    @staticmethod
+    def assert_btree_properties(tree):
+        """Validates the keys count, children count, and leaves depths of every
+        node of a B-Tree
+        """
+        pool = tree._pool
+        min_keys = (tree.order - 1) // 2
+        leaves_depths = set()
+        stack = [(tree._root_id, 0)]
+        while stack:
+            node_id, depth = stack.pop()
+            n = pool.n_keys[node_id]
+            assert n < tree.order
+            assert node_id == tree._root_id or n >= min_keys
+            keys = pool.keys[node_id, :n]
+            assert np.all(keys[:-1] <= keys[1:])
+            if pool.children_ids[node_id, 0] == -1:
+                leaves_depths.add(depth)
+                continue
+            for c in pool.children_ids[node_id, :(n+1)]:
+                assert c != -1
+                stack.append((c, depth + 1))
+        assert len(leaves_depths) == 1